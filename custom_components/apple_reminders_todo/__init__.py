@@ -1,21 +1,44 @@
 """Apple Reminders integration for Home Assistant Todo lists."""
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import mmap
 import os
 import hashlib
 import voluptuous as vol
 
+from dataclasses import replace
+from functools import lru_cache
+
+try:
+    # Ships with Home Assistant core; parses large JSON blobs in C
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional; used to bulk-parse due dates for very large exports
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # Optional; used to stream-parse multi-MB reminder files
+    import ijson
+except ImportError:
+    ijson = None
+
 from homeassistant.components.todo import TodoItem, TodoItemStatus
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 from .const import (
     DOMAIN,
@@ -27,76 +50,294 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-CONFIG_SCHEMA = vol.Schema(
+# Built once at import; validator closures are reused across entries
+_INNER_SCHEMA = vol.Schema(
     {
-        DOMAIN: vol.Schema(
-            {
-                vol.Required(CONF_PATH): cv.string,
-                vol.Required(CONF_TODO_LIST): cv.string,
-                vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.Coerce(int),
-            }
-        )
-    },
-    extra=vol.ALLOW_EXTRA,
+        vol.Required(CONF_PATH): cv.string,
+        vol.Required(CONF_TODO_LIST): cv.string,
+        vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.Coerce(int),
+    }
+)
+
+CONFIG_SCHEMA = vol.Schema({DOMAIN: _INNER_SCHEMA}, extra=vol.ALLOW_EXTRA)
+
+SERVICE_UPDATE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("force"): cv.boolean,
+    }
 )
 
+# Above this size, stream-parse with ijson instead of loading the
+# whole document at once
+_STREAM_PARSE_MIN_BYTES = 1024 * 1024
+
+
+def _read_json_file_streaming(path: str) -> dict:
+    """Stream-parse a large reminders file with ijson.
+
+    Items are built one at a time rather than materializing the whole
+    object graph up front, keeping peak memory lower for multi-MB
+    exports. The top-level timestamp is extracted in a first pass that
+    stops as soon as it is found.
+    """
+    timestamp = None
+    with open(path, "rb") as f:
+        for value in ijson.items(f, "timestamp"):
+            timestamp = value
+            break
+    with open(path, "rb") as f:
+        items = list(ijson.items(f, "items.item"))
+    return {"timestamp": timestamp, "items": items}
+
+
 def _read_json_file(path: str) -> dict:
     """Read JSON file and return parsed data."""
+    if ijson is not None and os.path.getsize(path) > _STREAM_PARSE_MIN_BYTES:
+        return _read_json_file_streaming(path)
+    if orjson is not None:
+        with open(path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty or unmappable file; fall back to a plain read
+                return orjson.loads(f.read())
+            try:
+                # orjson parses straight from the mapping (via a
+                # zero-copy memoryview), skipping the file-sized bytes
+                # allocation of a read()
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    view.release()
+            finally:
+                mm.close()
     with open(path, "r") as f:
         return json.load(f)
 
+@lru_cache(maxsize=4096)
+def _parse_iso(due_str: str) -> datetime | None:
+    """Parse an ISO-8601 datetime string, caching the result.
+
+    The Apple export always emits ISO-8601, so try the much faster
+    datetime.fromisoformat first and only fall back to Home Assistant's
+    regex-based parser for anything it can't handle. Polling re-reads
+    the same JSON every scan_interval, so nearly every string repeats
+    between ticks and the cache skips the reparse.
+    """
+    try:
+        if due_str.endswith("Z"):
+            return datetime.fromisoformat(due_str[:-1] + "+00:00")
+        return datetime.fromisoformat(due_str)
+    except (ValueError, TypeError, AttributeError):
+        return dt_util.parse_datetime(due_str)
+
+
+def _parse_due(due_str: str) -> datetime | None:
+    """Parse and localize a due date.
+
+    Only the parse itself is cached (in _parse_iso); localization runs
+    per call so a runtime change of the Home Assistant timezone is
+    picked up on the next poll.
+    """
+    due_date = _parse_iso(due_str)
+    if due_date is None:
+        return None
+    # Convert to the local timezone that Home Assistant uses
+    # This is crucial for compatibility with iCal. Only go through the
+    # astimezone machinery when the value isn't already local; naive
+    # datetimes are treated as UTC, matching dt_util.as_local.
+    local_tz = dt_util.DEFAULT_TIME_ZONE
+    if due_date.tzinfo is local_tz:
+        return due_date
+    if due_date.tzinfo is None:
+        due_date = due_date.replace(tzinfo=dt_util.UTC)
+    return due_date.astimezone(local_tz)
+
+
+@lru_cache(maxsize=4096)
+def _uid_for(title: str, creation_time: str) -> bytes:
+    """Hash a title/creation-time pair into a stable 8-byte digest.
+
+    blake2b with an 8-byte digest is deterministic across restarts
+    (Home Assistant correlates todos by UID) but noticeably faster
+    than md5, and the NUL separator avoids f-string ambiguity. The raw
+    digest is used as the diff key; it is hex-encoded only at the
+    TodoItem boundary.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    h.update(title.encode())
+    h.update(b"\x00")
+    h.update(creation_time.encode())
+    return h.digest()
+
+
+def _uid_digest(reminder: dict) -> bytes:
+    """Return the stable digest for a reminder."""
+    return _uid_for(reminder.get('title', ''), reminder.get('creationDateTime', ''))
+
+
 def generate_stable_uid(reminder: dict) -> str:
     """Generate a stable, unique ID for a reminder."""
-    # Get title and creation time with fallbacks
-    title = reminder.get('title', '')
-    creation_time = reminder.get('creationDateTime', '')
-    
-    # Combine to create a unique identifier
-    uid_base = f"{title}_{creation_time}"
-    
-    return hashlib.md5(uid_base.encode()).hexdigest()
+    return _uid_digest(reminder).hex()
+
+
+# Below this many distinct due dates the per-string cached parse wins
+_BULK_PARSE_MIN_ITEMS = 500
+
+
+def _bulk_parse_due(due_strs: list) -> dict | None:
+    """Parse many ISO due dates in one numpy call.
+
+    Expects a list of strings. Returns a mapping of due string ->
+    localized datetime, or None when numpy is unavailable or the
+    strings aren't uniformly UTC-suffixed (numpy's datetime64 parser is
+    offset-naive), in which case the caller falls back to per-string
+    parsing.
+    """
+    if np is None or not all(s.endswith("Z") for s in due_strs):
+        return None
+    try:
+        arr = np.array([s[:-1] for s in due_strs], dtype="datetime64[us]")
+    except ValueError:
+        return None
+    return {
+        due_str: dt_util.as_local(parsed.replace(tzinfo=dt_util.UTC))
+        for due_str, parsed in zip(due_strs, arr.astype(object))
+    }
+
+
+def _build_items(reminders: list) -> dict:
+    """Transform raw reminders into TodoItems keyed by stable UID.
+
+    This is pure CPU work (hashing, formatting, date parsing), so it is
+    run as a single executor job to keep the event loop free.
+    """
+    # For very large exports, hand all distinct due dates to numpy at
+    # once instead of parsing string by string. Malformed entries
+    # (non-dict reminders, non-string due dates) are filtered here so
+    # they degrade per-item in the loop below instead of aborting the
+    # whole batch.
+    bulk_due = None
+    due_strs = {
+        s
+        for r in reminders
+        if isinstance(r, dict)
+        if isinstance(s := r.get('dueDateTime'), str) and s
+    }
+    if len(due_strs) >= _BULK_PARSE_MIN_ITEMS:
+        bulk_due = _bulk_parse_due(list(due_strs))
+
+    # Evaluated once; keeps per-item debug formatting off the hot path
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+
+    # One template item shared by the whole batch; replace() copies it
+    # without re-running the dataclass default handling per reminder
+    base = TodoItem(uid="", summary="")
+
+    desired = {}
+    for reminder in reminders:
+        try:
+            # Look each field up once per reminder
+            title = reminder.get('title', '')
+            digest = _uid_for(title, reminder.get('creationDateTime', ''))
+
+            # Parse the due date if available
+            due_date = None
+            due_date_str = reminder.get('dueDateTime')
+            if due_date_str:
+                try:
+                    if bulk_due is not None:
+                        due_date = bulk_due.get(due_date_str)
+                    else:
+                        due_date = _parse_due(due_date_str)
+                    if due_date:
+                        if debug_enabled:
+                            _LOGGER.debug("Processed due date %s as %s", due_date_str, due_date)
+                    else:
+                        _LOGGER.warning("Could not parse due date: %s", due_date_str)
+                except (ValueError, TypeError) as err:
+                    _LOGGER.warning("Failed to parse due date %s: %s", due_date_str, err)
+
+            desired[digest] = replace(
+                base,
+                uid=digest.hex(),
+                summary=title,
+                status=TodoItemStatus.COMPLETED if reminder.get('isCompleted') else TodoItemStatus.NEEDS_ACTION,
+                description=create_rich_description(reminder),
+                due=due_date,
+            )
+
+        except Exception as item_err:
+            _LOGGER.error("Error building todo item for %s: %s", reminder.get('title'), item_err)
+
+    return desired
+
+
+def _items_differ(old: TodoItem, new: TodoItem) -> bool:
+    """Return True if two todo items differ in any field we sync."""
+    return (
+        old.summary != new.summary
+        or old.status != new.status
+        or old.description != new.description
+        or old.due != new.due
+    )
 
 
 def create_rich_description(reminder: dict) -> str:
     """Create a rich description including all reminder metadata."""
-    # Format tags if present
-    tags_text = ""
-    if reminder.get('tags') and len(reminder['tags']) > 0:
-        tags_text = f"Tags: {', '.join(reminder['tags'])}"
-    
-    # Build the description with all available metadata
-    description_parts = [
-        f"Priority: {reminder.get('priority')}" if reminder.get('priority') and reminder.get('priority') != "None" else "",
-        f"Flagged: Yes" if reminder.get('isFlagged') else "",
-        tags_text,
-        f"List: {reminder.get('list')}" if reminder.get('list') else "",
-        f"Created: {reminder.get('creationDateTime')}" if reminder.get('creationDateTime') else ""
-    ]
-    
-    # Filter out empty parts and join with line breaks
-    return "\n".join([part for part in description_parts if part])
+    # Build only the parts that are present, each field looked up once
+    parts = []
+    priority = reminder.get('priority')
+    if priority and priority != "None":
+        parts.append(f"Priority: {priority}")
+    if reminder.get('isFlagged'):
+        parts.append("Flagged: Yes")
+    tags = reminder.get('tags')
+    if tags:
+        parts.append("Tags: " + ", ".join(tags))
+    list_name = reminder.get('list')
+    if list_name:
+        parts.append(f"List: {list_name}")
+    created = reminder.get('creationDateTime')
+    if created:
+        parts.append(f"Created: {created}")
+    return "\n".join(parts)
 
 
-async def update_todos_from_json(hass: HomeAssistant, path: str, todo_entity_id: str, last_timestamp=None) -> str:
-    """Update Home Assistant todos from JSON file. Returns the new timestamp."""
+async def update_todos_from_json(hass: HomeAssistant, path: str, todo_entity_id: str, storage: dict, force: bool = False) -> None:
+    """Update Home Assistant todos from JSON file.
+
+    Change tracking (file mtime and the JSON-embedded timestamp) is kept
+    in the caller-owned storage dict so unchanged files are skipped.
+    """
+    last_timestamp = None if force else storage.get("last_timestamp")
     try:
-        # Check file existence in an executor
-        file_exists = await hass.async_add_executor_job(os.path.exists, path)
-        if not file_exists:
+        # Stat the file in an executor; this doubles as the existence check
+        try:
+            st = await hass.async_add_executor_job(os.stat, path)
+        except OSError:
             _LOGGER.warning("JSON file not found: %s", path)
-            return last_timestamp
+            return
+
+        # If the file hasn't been touched since the last poll, skip the
+        # read and parse entirely
+        if not force and st.st_mtime_ns == storage.get("last_mtime_ns"):
+            _LOGGER.debug("JSON file unchanged on disk (mtime), skipping")
+            return
 
         # Read the JSON file in an executor
         json_data = await hass.async_add_executor_job(_read_json_file, path)
-            
+
         # Get the timestamp from the JSON
         json_timestamp = json_data.get("timestamp")
-        
+
         # Only process if timestamp has changed
         if last_timestamp is not None and json_timestamp == last_timestamp:
             _LOGGER.debug("JSON data hasn't changed since last update (timestamp: %s), skipping", json_timestamp)
-            return last_timestamp
-        
+            storage["last_mtime_ns"] = st.st_mtime_ns
+            return
+
         _LOGGER.info("JSON data has changed (old timestamp: %s, new timestamp: %s), updating todos", 
                     last_timestamp, json_timestamp)
         
@@ -109,121 +350,144 @@ async def update_todos_from_json(hass: HomeAssistant, path: str, todo_entity_id:
         
         if not todo_entity:
             _LOGGER.error("Todo entity not found: %s", todo_entity_id)
-            return json_timestamp  # Still return the timestamp so we don't reprocess
-        
-        # Get existing todos
+            # Still record the change markers so we don't reprocess
+            storage["last_mtime_ns"] = st.st_mtime_ns
+            storage["last_timestamp"] = json_timestamp
+            return
+
+        # Get existing todos keyed by the raw digest; bytes keys hash
+        # faster than hex strings in the set-diff below
         existing_todos = todo_entity.todo_items or []
-        
-        # Delete all existing items in one operation
-        if existing_todos:
+        existing_by_key = {}
+        foreign_uids = []
+        for existing in existing_todos:
+            if not existing.uid:
+                continue
             try:
-                uids_to_remove = [item.uid for item in existing_todos if item.uid]
-                if uids_to_remove:
-                    _LOGGER.debug("Removing all %d existing items", len(uids_to_remove))
-                    await todo_entity.async_delete_todo_items(uids=uids_to_remove)
-                    _LOGGER.debug("Successfully removed all existing items")
+                existing_by_key[bytes.fromhex(existing.uid)] = existing
+            except ValueError:
+                # Not a UID we generated; treat it as stale
+                foreign_uids.append(existing.uid)
+
+        # Build the desired state keyed by stable UID in an executor so
+        # the per-item hashing/formatting doesn't block the event loop
+        desired = await hass.async_add_executor_job(_build_items, reminders)
+
+        # Diff against the existing list so unchanged items are left alone:
+        # delete UIDs that disappeared, create UIDs that are new, and
+        # recreate items whose content changed (e.g. completion toggled)
+        to_delete = foreign_uids + [
+            existing_by_key[key].uid for key in existing_by_key if key not in desired
+        ]
+        to_add = [item for key, item in desired.items() if key not in existing_by_key]
+        for key, item in desired.items():
+            existing = existing_by_key.get(key)
+            if existing is not None and _items_differ(existing, item):
+                to_delete.append(existing.uid)
+                to_add.append(item)
+
+        if to_delete:
+            try:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Removing %d stale items", len(to_delete))
+                await todo_entity.async_delete_todo_items(uids=to_delete)
             except Exception as del_err:
                 _LOGGER.warning("Error during bulk deletion: %s", del_err)
-        
-        # Add new items from JSON
+
         added_count = 0
-        for reminder in reminders:
-            try:
-                item = TodoItem(
-                    uid=generate_stable_uid(reminder),
-                    summary=reminder.get('title', ''),
-                    status=TodoItemStatus.COMPLETED if reminder.get('isCompleted') else TodoItemStatus.NEEDS_ACTION,
-                    description=create_rich_description(reminder),
-                )
-                
-                # Add due date if available
-                due_date_str = reminder.get('dueDateTime')
-                if due_date_str:
-                    try:
-                        due_date = dt_util.parse_datetime(due_date_str)
-                        if due_date:
-                            # Convert to the local timezone that Home Assistant uses
-                            # This is crucial for compatibility with iCal
-                            due_date = dt_util.as_local(due_date)
-                            item.due = due_date
-                            _LOGGER.debug("Processed due date %s as %s", due_date_str, due_date)
-                        else:
-                            _LOGGER.warning("Could not parse due date: %s", due_date_str)
-                    except (ValueError, TypeError) as err:
-                        _LOGGER.warning("Failed to parse due date %s: %s", due_date_str, err)
-                
-                # Create new item
-                await todo_entity.async_create_todo_item(item=item)
-                added_count += 1
-                    
-            except Exception as item_err:
-                _LOGGER.error("Error creating todo item for %s: %s", reminder.get('title'), item_err)
-        
-        _LOGGER.info("Todo list update complete: removed %d existing items, added %d new items", 
-                    len(existing_todos), added_count)
-        
-        return json_timestamp
-        
+        if to_add:
+            # Issue creates concurrently so the backend can overlap its
+            # I/O, but bound concurrency to avoid overwhelming it
+            semaphore = asyncio.Semaphore(32)
+
+            async def _create(item: TodoItem) -> None:
+                async with semaphore:
+                    await todo_entity.async_create_todo_item(item=item)
+
+            results = await asyncio.gather(
+                *(_create(item) for item in to_add), return_exceptions=True
+            )
+            for item, result in zip(to_add, results):
+                if isinstance(result, Exception):
+                    _LOGGER.error("Error creating todo item %s: %s", item.summary, result)
+                else:
+                    added_count += 1
+
+        _LOGGER.info("Todo list update complete: removed %d items, added %d items, %d unchanged",
+                    len(to_delete), added_count, len(desired) - len(to_add))
+
+        storage["last_mtime_ns"] = st.st_mtime_ns
+        storage["last_timestamp"] = json_timestamp
+
     except Exception as ex:
         _LOGGER.error("Error updating todos: %s", ex)
-        return last_timestamp
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Apple Reminders Todo from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
-    
-    path = entry.data[CONF_PATH]
-    todo_entity_id = entry.data[CONF_TODO_LIST]
-    scan_interval = entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-    
-    # Data storage for this entry
-    entry_data = {
-        "last_timestamp": None
-    }
-    hass.data[DOMAIN][entry.entry_id] = entry_data
-    
+async def _async_start_sync(hass: HomeAssistant, path: str, todo_entity_id: str, scan_interval: int, storage: dict):
+    """Register the update service and poll interval, then run the first sync.
+
+    Shared by config-entry and YAML setup so the service/interval wiring
+    exists only once. Returns the interval's unsubscribe callback.
+    """
     # Create service to manually trigger update
     async def handle_update_service(call: ServiceCall) -> None:
         """Handle the service call."""
         force_update = call.data.get("force", False)
-        timestamp_to_use = None if force_update else entry_data["last_timestamp"]
-        
-        entry_data["last_timestamp"] = await update_todos_from_json(
-            hass, path, todo_entity_id, timestamp_to_use
+        await update_todos_from_json(
+            hass, path, todo_entity_id, storage, force=force_update
         )
-    
+
     hass.services.async_register(
-        DOMAIN, 
-        "update_todos", 
+        DOMAIN,
+        "update_todos",
         handle_update_service,
-        vol.Schema({
-            vol.Optional("force"): cv.boolean,
-        })
+        SERVICE_UPDATE_SCHEMA,
     )
-    
-    # Set up periodic updates with proper threading approach
+
+    # Set up periodic updates; defined once here rather than per tick
+    async def _update_with_timestamp():
+        await update_todos_from_json(hass, path, todo_entity_id, storage)
+
+    @callback
     def _handle_interval(now):
         """Handle interval timer callback."""
-        async def _update_with_timestamp():
-            entry_data["last_timestamp"] = await update_todos_from_json(
-                hass, path, todo_entity_id, entry_data["last_timestamp"]
-            )
-        hass.add_job(_update_with_timestamp)
-    
-    # Store the remove callback function so we can clean up on unload
-    entry.async_on_unload(
-        async_track_time_interval(
-            hass, 
-            _handle_interval,
-            timedelta(seconds=scan_interval)
-        )
+        # Runs in the event loop, so the update coroutine can be
+        # scheduled directly without hass.add_job's job-type dispatch
+        hass.async_create_task(_update_with_timestamp())
+
+    remove_interval = async_track_time_interval(
+        hass,
+        _handle_interval,
+        timedelta(seconds=scan_interval)
     )
-    
+
     # Initial update
-    entry_data["last_timestamp"] = await update_todos_from_json(
-        hass, path, todo_entity_id, None  # Force first update
+    await update_todos_from_json(
+        hass, path, todo_entity_id, storage, force=True  # Force first update
     )
-    
+
+    return remove_interval
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up Apple Reminders Todo from a config entry."""
+    hass.data.setdefault(DOMAIN, {})
+
+    path = entry.data[CONF_PATH]
+    todo_entity_id = entry.data[CONF_TODO_LIST]
+    scan_interval = entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+
+    # Data storage for this entry
+    entry_data = {
+        "last_timestamp": None,
+        "last_mtime_ns": None,
+    }
+    hass.data[DOMAIN][entry.entry_id] = entry_data
+
+    # Store the remove callback function so we can clean up on unload
+    entry.async_on_unload(
+        await _async_start_sync(hass, path, todo_entity_id, scan_interval, entry_data)
+    )
+
     return True
 
 
@@ -246,51 +510,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     path = config[DOMAIN][CONF_PATH]
     todo_entity_id = config[DOMAIN][CONF_TODO_LIST]
     scan_interval = config[DOMAIN].get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-    
+
     # Data storage
     component_data = {
-        "last_timestamp": None
+        "last_timestamp": None,
+        "last_mtime_ns": None,
     }
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN]["yaml"] = component_data
-    
-    # Create service to manually trigger update
-    async def handle_update_service(call: ServiceCall) -> None:
-        """Handle the service call."""
-        force_update = call.data.get("force", False)
-        timestamp_to_use = None if force_update else component_data["last_timestamp"]
-        
-        component_data["last_timestamp"] = await update_todos_from_json(
-            hass, path, todo_entity_id, timestamp_to_use
-        )
-    
-    hass.services.async_register(
-        DOMAIN, 
-        "update_todos", 
-        handle_update_service,
-        vol.Schema({
-            vol.Optional("force"): cv.boolean,
-        })
-    )
-    
-    # Set up periodic updates with proper threading approach
-    def _handle_interval(now):
-        """Handle interval timer callback."""
-        async def _update_with_timestamp():
-            component_data["last_timestamp"] = await update_todos_from_json(
-                hass, path, todo_entity_id, component_data["last_timestamp"]
-            )
-        hass.add_job(_update_with_timestamp)
-    
-    async_track_time_interval(
-        hass, 
-        _handle_interval,
-        timedelta(seconds=scan_interval)
-    )
-    
-    # Initial update
-    component_data["last_timestamp"] = await update_todos_from_json(
-        hass, path, todo_entity_id, None  # Force first update
-    )
-    
-    return True
\ No newline at end of file
+
+    await _async_start_sync(hass, path, todo_entity_id, scan_interval, component_data)
+
+    return True